@@ -1,74 +1,224 @@
+import csv
+import os
+import re
+import threading
 import streamlit as st
 import pandas as pd
-from datetime import datetime
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import quote
 import plotly.graph_objects as go
 
+# Copy-on-Write and Arrow-backed strings are the defaults from pandas 3.0; opt in on 2.x so
+# filtered slices stay lazy and text columns, categories and Parquet reads skip Python objects
+_PD_MAJOR, _PD_MINOR = (int(part) for part in pd.__version__.split('.')[:2])
+if _PD_MAJOR == 2:
+    pd.set_option('mode.copy_on_write', True)
+    if _PD_MINOR >= 1:
+        pd.set_option('future.infer_string', True)
+
+# Currency, percent, thousands separators and whitespace stripped from numeric text. Kept as a
+# plain string: pandas only hands string patterns to the Arrow regex kernel, compiled ones run per element
+_STRIP_PATTERN = r'[%₹,\s]'
+
+# Date formats written by the scraper, tried in order (two- then four-digit year)
+_DATE_FORMATS = ['%d-%b-%y', '%d-%b-%Y']
+
+# Columns the dashboard reads from the CSV, and types the Arrow parser can produce directly
+USECOLS = ["Today's Date", 'Symbol', 'LTP', '%chng', 'Market Cap', 'Sector', 'Industry',
+           'Series Type', 'About', 'ROE', 'ROCE', 'P/E Ratio', 'Book Value',
+           'Dividend Yield', 'Days Since High']
+# Dates and numbers stay text here: parse_dates and the numeric cleaning loop handle stray
+# formats (e.g. "1,250.55") without failing the load
+COLUMN_TYPES = {
+    "Today's Date": pa.string(),
+    'Symbol': pa.string(),
+    'LTP': pa.string(),
+    'Days Since High': pa.string(),
+    'Sector': pa.dictionary(pa.int32(), pa.string()),
+    'Industry': pa.dictionary(pa.int32(), pa.string()),
+}
+
+def read_csv(file):
+    """Parse the CSV into Arrow buffers on multiple threads and hand it to pandas"""
+    # Optional columns (e.g. Book Value) may be missing, so only request those in the header
+    with open(file, newline='', encoding='utf-8') as f:
+        header = next(csv.reader(f))
+    columns = [col for col in USECOLS if col in header]
+
+    table = pacsv.read_csv(file, convert_options=pacsv.ConvertOptions(
+        include_columns=columns,
+        column_types={col: typ for col, typ in COLUMN_TYPES.items() if col in columns},
+        strings_can_be_null=True,
+    ))
+    # Dictionary columns arrive as categoricals; plain strings stay Arrow-backed
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+
+def parse_dates(dates):
+    """Parse date strings against the known formats, inferring only rows that match neither"""
+    parsed = pd.to_datetime(dates, format=_DATE_FORMATS[0], errors='coerce')
+    for fmt in [*_DATE_FORMATS[1:], 'mixed']:
+        missing = parsed.isna() & dates.notna()
+        if not missing.any():
+            break
+        # Unparseable dates become NaT instead of failing the whole load
+        parsed[missing] = pd.to_datetime(dates[missing], format=fmt, errors='coerce')
+    return parsed
+
+def clean_data(df):
+    """Convert the raw CSV columns to typed numeric, date and text columns"""
+    df["Today's Date"] = parse_dates(df["Today's Date"])
+
+    # Clean percentage change and numeric columns in a single regex pass
+    numeric_columns = ['LTP', '%chng', 'ROE', 'ROCE', 'P/E Ratio', 'Book Value', 'Dividend Yield',
+                       'Days Since High']
+    for col in numeric_columns:
+        if col in df.columns:
+            s = df[col]
+            if not pd.api.types.is_numeric_dtype(s):
+                s = s.str.replace(_STRIP_PATTERN, '', regex=True)
+            # Arrow-backed strings convert to nullable Float64; keep plain float64 with NaN
+            df[col] = pd.to_numeric(s, errors='coerce').astype('float64')
+
+    # Clean Market Cap column
+    market_cap = df['Market Cap'].astype(str).str.replace(_STRIP_PATTERN, '', regex=True)
+    df['Market Cap'] = pd.to_numeric(market_cap.str.extract(r'(\d+(?:\.\d+)?)', expand=False), errors='coerce').astype('float64')
+
+    # Clean Symbol column; the grouping keys are stored as categoricals so groupbys run on integer codes
+    df['Symbol'] = df['Symbol'].str.strip().str.upper().astype('category')
+    df['Series Type'] = df['Series Type'].fillna('N/A').astype('category')
+
+    # Rows are kept in date order (same-day rows in file order) so date filters can slice them
+    df = df.sort_values("Today's Date", kind='stable', ignore_index=True)
+
+    # Running high of each symbol up to every date, in one pass over the whole dataset
+    df['High_LTP'] = df.groupby('Symbol', sort=False, observed=True)['LTP'].cummax()
+
+    return df
+
 @st.cache_data
 def load_data(file):
-    """Load and preprocess the data"""
+    """Load and preprocess the data, reusing the cleaned Parquet copy while it is current"""
     try:
-        df = pd.read_csv(file)
-        # url = "https://raw.githubusercontent.com/DataInvestor04/52WH/refs/heads/main/financial_metrics.csv"
-        # df = pd.read_csv(url)
-        df["Today's Date"] = pd.to_datetime(df["Today's Date"])
-
-        # Clean percentage change column
-        df['%chng'] = df['%chng'].astype(str).str.replace('%', '').str.strip()
-        df['%chng'] = pd.to_numeric(df['%chng'], errors='coerce')
-
-        # Clean numeric columns
-        numeric_columns = ['ROE', 'ROCE', 'P/E Ratio', 'Book Value', 'Dividend Yield']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = df[col].astype(str).str.replace('%', '').str.replace('₹', '')
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-
-        # Clean Market Cap column
-        df['Market Cap'] = df['Market Cap'].astype(str).str.replace('₹', '').str.replace(',', '')
-        df['Market Cap'] = pd.to_numeric(df['Market Cap'].str.extract(r'(\d+(?:\.\d+)?)', expand=False), errors='coerce')
-
-        # Clean Symbol column
-        df['Symbol'] = df['Symbol'].astype(str).str.strip().str.upper()
-        df['Series Type'] = df['Series Type'].fillna('N/A')
-        df['Series Type'] = df['Series Type'].astype(str)
-
+        csv_path = Path(file)
+        parquet_path = csv_path.with_suffix('.parquet')
+        # The copy is stale if either the CSV or the cleaning code changed after it was written
+        source_mtime = max(csv_path.stat().st_mtime, Path(__file__).stat().st_mtime)
+        if parquet_path.exists() and parquet_path.stat().st_mtime >= source_mtime:
+            df = pd.read_parquet(parquet_path)
+        else:
+            df = read_csv(csv_path)
+            # url = "https://raw.githubusercontent.com/DataInvestor04/52WH/refs/heads/main/financial_metrics.csv"
+            # df = pd.read_csv(url)
+            df = clean_data(df)
+
+            # Write beside the target and swap it in, so a concurrent session never reads a partial file
+            tmp_path = parquet_path.with_name(f'.{parquet_path.name}.{os.getpid()}.tmp')
+            try:
+                df.to_parquet(tmp_path, compression='zstd')
+                os.replace(tmp_path, parquet_path)
+            except Exception:
+                # A failed write only skips the cache; read-only deployments keep working from the CSV
+                tmp_path.unlink(missing_ok=True)
+
+        # Hash the content once per load; attrs survive the cache round trip, so reruns reuse it
+        df.attrs['version'] = int(pd.util.hash_pandas_object(df, index=False).sum())
         return df
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
         return pd.DataFrame()
     
-def get_stock_highs(data, symbol):
+def date_slice(data, start_date, end_date):
+    """Rows dated start_date through end_date, found by binary search over the date-sorted data"""
+    dates = data["Today's Date"].to_numpy()
+    bounds = np.array([start_date, end_date + pd.Timedelta(days=1)], dtype='datetime64[D]').astype(dates.dtype)
+    lo, hi = np.searchsorted(dates, bounds, side='left')
+    return data.iloc[lo:hi]
+
+def data_version(data):
+    """Fingerprint of a loaded dataset, used as a cache key in place of hashing it on every rerun"""
+    # A content hash, so a CSV fixed in place with the same length and dates still gets fresh indexes
+    return len(data), data.attrs['version']
+
+# Per-dataset caches keep the current version and the one before it, so a CSV update does not
+# pile up full sorted copies of old data (Clear cache does not reach st.cache_resource)
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _symbol_index(_data, version):
+    """Frame sorted by symbol then date, with the row range of every symbol code, built once per dataset"""
+    by_symbol = _data.sort_values(['Symbol', "Today's Date"], ignore_index=True)
+    # Sorted codes put each symbol's rows in one contiguous range (missing symbols sort last as -1)
+    codes = by_symbol['Symbol'].cat.codes.to_numpy()
+    n_symbols = len(by_symbol['Symbol'].cat.categories)
+    bounds = np.searchsorted(codes[:np.count_nonzero(codes >= 0)], np.arange(n_symbols + 1))
+    return by_symbol, bounds
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def month_labels(_dates, version):
+    """Month name and year ("January 2025") for each date, computed only for the Month view"""
+    # Categories follow calendar order, so the month list needs no string-based sort
+    codes, periods = pd.factorize(_dates.dt.to_period('M'), sort=True)
+    labels = pd.Categorical.from_codes(codes, categories=periods.strftime('%B %Y'))
+    return pd.Series(labels, index=_dates.index)
+
+@st.cache_data(show_spinner=False)
+def get_stock_highs(_data, symbol, version):
     """Get dates when the stock made new highs"""
     if symbol:
-        stock_data = data[data['Symbol'] == symbol].copy()
-        if not stock_data.empty:
-            stock_data = stock_data.sort_values("Today's Date")
-            stock_data['High_LTP'] = stock_data['LTP'].cummax()
-            high_dates = stock_data[stock_data['LTP'] == stock_data['High_LTP']].copy()
+        by_symbol, bounds = _symbol_index(_data, version)
+        code = by_symbol['Symbol'].cat.categories.get_indexer([symbol])[0]
+        if code >= 0 and bounds[code] < bounds[code + 1]:
+            # A positional slice of the symbol's rows, with no index rebuild
+            stock_data = by_symbol.iloc[bounds[code]:bounds[code + 1]]
+            high_dates = stock_data[stock_data['LTP'] == stock_data['High_LTP']]
             return high_dates, stock_data
     return pd.DataFrame(), pd.DataFrame()
 
-def get_latest_stock_data(filtered_data):
+def _first_valid_rows(values, symbol_codes, n_symbols):
+    """Row position of each symbol code's first non-missing value, or -1 if it has none"""
+    rows = np.flatnonzero((symbol_codes >= 0) & values.notna().to_numpy())
+    codes, first = np.unique(symbol_codes[rows], return_index=True)
+    positions = np.full(n_symbols, -1)
+    positions[codes] = rows[first]
+    return positions
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def get_latest_stock_data(_filtered_data, filter_key):
     """Get the latest data for each stock with count"""
-    stock_counts = filtered_data['Symbol'].value_counts().to_dict()
-    latest_data = filtered_data.sort_values(["Today's Date", '%chng'], ascending=[False, False]).groupby('Symbol').first().reset_index()
-    latest_data['count'] = latest_data['Symbol'].map(stock_counts)
-    return latest_data.sort_values('count', ascending=False)
+    grouped = _filtered_data.groupby('Symbol', observed=True)
+    # Each symbol's rows on its latest date; idxmax picks the one with the larger change, as the
+    # old date/%chng sort did, without sorting the whole frame
+    on_latest = _filtered_data[_filtered_data["Today's Date"] == grouped["Today's Date"].transform('max')]
+    lead = on_latest['%chng'].fillna(-np.inf).groupby(on_latest['Symbol'], observed=True).idxmax().to_numpy()
+
+    # With the leading rows first, each column takes the lead's value or else the first same-day
+    # row that has one, the gaps first() used to fill
+    candidates = pd.concat([on_latest.loc[lead], on_latest.drop(index=lead)])
+    codes = candidates['Symbol'].cat.codes.to_numpy().astype('int64')
+    n_symbols = len(candidates['Symbol'].cat.categories)
+    present = codes[:len(lead)]
+    latest_data = pd.DataFrame({
+        col: candidates[col].array.take(_first_valid_rows(candidates[col], codes, n_symbols)[present], allow_fill=True)
+        for col in candidates.columns
+    })
+    # size() shares the group order of the leading rows, so the counts line up by position
+    latest_data['count'] = grouped.size().to_numpy()
+    return latest_data.sort_values('count', ascending=False, kind='stable')
 
 def format_metric_value(value, precision=2):
     """Format metric value with proper type checking"""
     try:
         if pd.isna(value):
             return "N/A"
-        if isinstance(value, str):
-            # Try to convert string to float
-            value = float(value.replace('₹', '').replace(',', '').strip())
+        # Values arrive numeric: clean_data converts every metric column at load time
         return f"{value:.{precision}f}"
     except (ValueError, TypeError):
         return "N/A"
 
 def create_metric_container(label, value, unit="", color="white", trend=None):
-    """Create an enhanced metric container with better typography and colors"""
+    """Create the HTML for an enhanced metric container with better typography and colors"""
     trend_color = {
         "up": "#22C55E",
         "down": "#EF4444",
@@ -81,8 +231,7 @@ def create_metric_container(label, value, unit="", color="white", trend=None):
         None: ""
     }
     
-    st.markdown(
-        f"""
+    return f"""
         <div style="background-color: rgba(30, 34, 45, 0.98); padding: 15px; border-radius: 8px; 
                     margin: 8px 0; border: 1px solid rgba(255, 255, 255, 0.1);">
             <div style="color: #A5B4FC; font-size: 13px; font-weight: 500; 
@@ -93,144 +242,187 @@ def create_metric_container(label, value, unit="", color="white", trend=None):
                     {value}{' ' + unit if unit else ''} {trend_icon[trend]}
                 </span>
             </div>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+        </div>"""
+
+# Cards sent per markdown message; smaller chunks paint sooner, larger ones mean fewer messages
+CARDS_PER_CHUNK = 20
+
+# Simple card background; cards are no longer colored by performance
+STOCK_CARD_STYLE = """
+    <style>
+    .stock-card {
+        background-color: rgba(255, 255, 255, 0.5);
+        border-radius: 12px;
+        padding: 5px;
+        margin-bottom: 24px;
+        border: 1px solid rgba(255, 255, 255, 1);
+    }
+    .stock-header {
+        display: flex;
+        align-items: center;
+        margin-bottom: 24px;
+    }
+    .stock-title {
+        font-size: 28px;
+        font-weight: 700;
+        color: #A5B4FC;
+    }
+    .stock-row {
+        display: flex;
+        gap: 16px;
+    }
+    .stock-row > div {
+        flex: 1;
+        min-width: 0;
+    }
+    </style>"""
 
 def create_stock_card(row):
-    """Create a stock card with simple background color based on performance"""
-    # Determine background color based on price change
+    """Create the HTML for one stock card"""
+    symbol = row['Symbol']
+    price = row['_ltp_fmt']
     price_change = row['%chng']
-    # if price_change >= 2:
-    #     bg_color = "rgba(255, 255, 255, 1)"  # Green
-    # elif price_change >= 0:
-    #     bg_color = "rgba(255, 255, 255, 1)"  # Blue
-    # else:
-    bg_color = "rgba(255, 255, 255, 0.5)"  # Red
-
-    st.markdown(f"""
-        <style>
-        .stock-card {{
-            background-color: {bg_color};
-            border-radius: 12px;
-            padding: 5px;
-            margin-bottom: 24px;
-            border: 1px solid rgba(255, 255, 255, 1);
-        }}
-        .stock-header {{
-            display: flex;
-            align-items: center;
-            margin-bottom: 24px;
-        }}
-        .stock-title {{
-            font-size: 28px;
-            font-weight: 700;
-            color: #A5B4FC;
-        }}
-        </style>
-    """, unsafe_allow_html=True)
+    price_color = "#22C55E" if price_change >= 0 else "#EF4444"
 
-    with st.container():
-        st.markdown('<div class="stock-card">', unsafe_allow_html=True)
-        
-        # Header Section
-        symbol = row['Symbol']
-        col1, col2, col3 = st.columns([3, 1, 1])
-        with col1:
-            st.markdown(f"""
-            <div class="stock-header">
-                <div>
-                    <div class="stock-title">
-                    <span>
-                        <a href="https://www.screener.in/company/{symbol}">
-                            {row['Symbol']}   
-                        </a>
-                        <strong>       ({row['Series Type']})</strong>
-                    </span>
-                    </div>
-                    <div>
-                        <span style="margin-right: 20px; color: #E2E8F0;">
-                            <strong>Sector:</strong> {row.get('Sector', 'N/A')}
-                        </span>
-                    </div>
+    # Header Section: title block takes three of five columns, price the remaining two
+    header = f"""
+        <div class="stock-row">
+            <div style="flex: 3;">
+                <div class="stock-header">
                     <div>
-                        <span style="color: #E2E8F0;">
-                            <strong>Industry:</strong> {row.get('Industry', 'N/A')}     
+                        <div class="stock-title">
+                        <span>
+                            <a href="https://www.screener.in/company/{quote(symbol, safe='')}">
+                                {row['Symbol']}   
+                            </a>
+                            <strong>       ({row['Series Type']})</strong>
                         </span>
+                        </div>
+                        <div>
+                            <span style="margin-right: 20px; color: #E2E8F0;">
+                                <strong>Sector:</strong> {row.get('Sector', 'N/A')}
+                            </span>
+                        </div>
+                        <div>
+                            <span style="color: #E2E8F0;">
+                                <strong>Industry:</strong> {row.get('Industry', 'N/A')}     
+                            </span>
+                        </div>
                     </div>
                 </div>
             </div>
-
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            price = format_number(row['LTP'])
-            price_change = row['%chng']
-            price_color = "#22C55E" if price_change >= 0 else "#EF4444"
-            st.markdown(f"""
-                <div style="text-align: right; width: 180%;">
-                    <div style="font-size: 30px; font-weight: 700; color: white;">{price}</div>
-                    <div style="font-size: 20px; font-weight: 600; color: {price_color};">
-                        {price_change:+.2f}% {' ↑' if price_change >= 0 else ' ↓'}
-                    </div>
+            <div style="flex: 2; text-align: right;">
+                <div style="font-size: 30px; font-weight: 700; color: white;">{price}</div>
+                <div style="font-size: 20px; font-weight: 600; color: {price_color};">
+                    {price_change:+.2f}% {' ↑' if price_change >= 0 else ' ↓'}
                 </div>
-            """, unsafe_allow_html=True)
-
-        # Metrics Grid
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            create_metric_container("Market Cap", 
-                                  format_number(row.get('Market Cap', 'N/A')),
-                                  color="#A5B4FC")
-            create_metric_container("Days Since High",
-                                  format_metric_value(row['Days Since High']),
-                                  color="#BAE6FD")
-
-        with col2:
-            create_metric_container("Stock P/E", 
-                                  format_metric_value(row.get('P/E Ratio', 'N/A')),
-                                  color="#93C5FD")
-            create_metric_container("ROE",
-                                  format_metric_value(row.get('ROE', 'N/A')),
+            </div>
+        </div>"""
+
+    # Metrics Grid
+    market_cap = create_metric_container("Market Cap",
+                                         row['_mcap_fmt'],
+                                         color="#A5B4FC")
+    days_since_high = create_metric_container("Days Since High",
+                                              format_metric_value(row['Days Since High']),
+                                              color="#BAE6FD")
+    pe_ratio = create_metric_container("Stock P/E",
+                                       format_metric_value(row.get('P/E Ratio')),
+                                       color="#93C5FD")
+    roe = create_metric_container("ROE",
+                                  format_metric_value(row.get('ROE')),
                                   unit="%",
                                   color="#FDA4AF")
+    dividend_yield = create_metric_container("Dividend Yield",
+                                             format_metric_value(row.get('Dividend Yield')),
+                                             unit="%",
+                                             color="#FCA5A5")
+    roce = create_metric_container("ROCE",
+                                   format_metric_value(row.get('ROCE')),
+                                   unit="%",
+                                   color="#FDBA74")
+    metrics = f"""
+        <div class="stock-row">
+            <div>{market_cap}{days_since_high}</div>
+            <div>{pe_ratio}{roe}</div>
+            <div>{dividend_yield}{roce}</div>
+        </div>"""
+
+    # About Section
+    about = ""
+    if 'About' in row and pd.notnull(row['About']) and str(row['About']) != 'nan':
+        about = f"""
+        <div style="margin-top: 20px; padding: 16px; background: rgba(30, 41, 59, 0.4); 
+                    border-radius: 8px; border: 1px solid rgba(255, 255, 255, 0.1);">
+            <div style="color: #A5B4FC; font-size: 16px; font-weight: 600; margin-bottom: 8px;">About</div>
+            <div style="color: #FFFFFF; font-size: 20px; line-height: 1.6;">{' '.join(str(row['About']).split())}</div>
+        </div>"""
+
+    return f'<div class="stock-card">{header}{metrics}{about}</div>'
+
+def iter_stock_card_chunks(stock_data, chunk_size=CARDS_PER_CHUNK):
+    """Yield the stock card markup a chunk of cards at a time, the style sheet leading the first chunk"""
+    stock_data = stock_data.assign(
+        _ltp_fmt=vec_format_number(stock_data['LTP']),
+        _mcap_fmt=vec_format_number(stock_data['Market Cap']),
+    )
+    records = stock_data.to_dict('records')
+    for start in range(0, len(records), chunk_size):
+        cards = "".join(create_stock_card(row) for row in records[start:start + chunk_size])
+        if start == 0:
+            cards = STOCK_CARD_STYLE + cards
+        # Indented or blank lines would break the markdown HTML block, so flatten the markup
+        yield "\n".join(line.strip() for line in cards.splitlines() if line.strip())
+
+# Filter states whose built stock card chunks are kept for reruns
+CARD_STORE_ENTRIES = 16
+
+@st.cache_resource(show_spinner=False)
+def _stock_card_store():
+    """Built stock card chunks per filter state (least recently used first), shared across sessions, and its lock"""
+    return OrderedDict(), threading.Lock()
+
+def render_stock_cards(stock_data, filter_key):
+    """Render the stock cards one markdown call per chunk, so the first cards paint before the rest are built"""
+    store, lock = _stock_card_store()
+    with lock:
+        chunks = store.get(filter_key)
+        if chunks is not None:
+            store.move_to_end(filter_key)
+    if chunks is not None:
+        for html in chunks:
+            st.markdown(html, unsafe_allow_html=True)
+        return
 
-        with col3:
-            create_metric_container("Dividend Yield",
-                                  format_metric_value(row.get('Dividend Yield', 'N/A')),
-                                  unit="%",
-                                  color="#FCA5A5")
-            create_metric_container("ROCE",
-                                  format_metric_value(row.get('ROCE', 'N/A')),
-                                  unit="%",
-                                  color="#FDBA74")
-
-        # About Section
-        if 'About' in row and pd.notnull(row['About']) and str(row['About']) != 'nan':
-            st.markdown(f"""
-                <div style="margin-top: 20px; padding: 16px; background: rgba(30, 41, 59, 0.4); 
-                            border-radius: 8px; border: 1px solid rgba(255, 255, 255, 0.1);">
-                    <div style="color: #A5B4FC; font-size: 16px; font-weight: 600; margin-bottom: 8px;">About</div>
-                    <div style="color: #FFFFFF; font-size: 20px; line-height: 1.6;">{row['About']}</div>
-                </div>
-            """, unsafe_allow_html=True)
+    # Cache miss: send each chunk as soon as the generator builds it, then keep the finished list
+    chunks = []
+    for html in iter_stock_card_chunks(stock_data):
+        st.markdown(html, unsafe_allow_html=True)
+        chunks.append(html)
+    with lock:
+        store[filter_key] = chunks
+        store.move_to_end(filter_key)
+        while len(store) > CARD_STORE_ENTRIES:
+            store.popitem(last=False)
 
-        st.markdown("</div>", unsafe_allow_html=True)
 def create_sector_chart(filtered_data):
     """Create an enhanced sector distribution chart"""
     sector_counts = filtered_data['Sector'].value_counts()
+    sector_counts = sector_counts[sector_counts > 0]
+    return _build_sector_chart(tuple(sector_counts.index), tuple(sector_counts.tolist()))
 
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _build_sector_chart(sectors, counts):
+    """Build the sector bar chart once per distinct set of counts"""
     fig = go.Figure()
     fig.add_trace(go.Bar(
-        x=sector_counts.index,
-        y=sector_counts.values,
+        x=sectors,
+        y=counts,
         marker_color='rgb(165, 180, 252)',
         marker_line_color='rgb(129, 140, 248)',
         marker_line_width=1.5,
         opacity=0.8,
-        text=sector_counts.values,
+        text=counts,
         textposition='auto',
     ))
     
@@ -263,8 +455,6 @@ def format_number(num):
     try:
         if pd.isna(num):
             return "N/A"
-        if isinstance(num, str):
-            num = float(num.replace('₹', '').replace(',', '').strip())
         
         if num >= 1e9:
             return f"₹{num/1e9:.2f}B"
@@ -277,24 +467,443 @@ def format_number(num):
     except (ValueError, TypeError):
         return "N/A"
 
-def get_stock_symbols(data, search_text):
-    """Get filtered list of stock symbols based on search text"""
-    if not search_text:
+def vec_format_number(values):
+    """Format a whole column like format_number, without a Python call per value"""
+    values = pd.Series(values)
+    x = pd.to_numeric(values, errors='coerce').to_numpy(dtype='float64')
+    conds = [x >= 1e9, x >= 1e7, x >= 1e5]
+    scaled = np.select(conds, [x / 1e9, x / 1e7, x / 1e5], default=x)
+    suffix = np.select(conds, ['B', 'Cr', 'L'], default='')
+
+    text = pd.Series(np.char.mod('%.2f', scaled), index=values.index)
+    # Unscaled values keep the thousands separators; negatives are never scaled, so they can need several.
+    # Each pass groups the rightmost ungrouped three digits; no lookahead, so Arrow's RE2 engine accepts it
+    unscaled = ~np.logical_or.reduce(conds)
+    grouped = text[unscaled]
+    while True:
+        regrouped = grouped.str.replace(r'(\d)(\d{3})([,.])', r'\1,\2\3', regex=True)
+        if regrouped.equals(grouped):
+            break
+        grouped = regrouped
+    text[unscaled] = grouped
+
+    formatted = '₹' + text + suffix
+    formatted[np.isnan(x)] = "N/A"
+    return formatted
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _symbol_sorted(_data, version):
+    """Unique symbols sorted case-insensitively, with their lowercase forms for prefix search"""
+    symbols = np.array(sorted(_data['Symbol'].dropna().unique().tolist(), key=str.lower))
+    return symbols, np.char.lower(symbols)
+
+def get_stock_symbols(data, search_text, version):
+    """Get filtered list of stock symbols starting with any of the space or comma separated search terms"""
+    terms = [term for term in re.split(r'[\s,]+', search_text.lower()) if term] if search_text else []
+    if not terms:
         return []
     
-    # Get unique symbols from the data
-    symbols = data['Symbol'].unique()
-    
-    # Filter symbols that start with the search text (case-insensitive)
-    filtered_symbols = [
-        symbol for symbol in symbols 
-        if symbol.lower().startswith(search_text.lower())
+    # Symbols starting with a term (case-insensitive) form one contiguous sorted range,
+    # so every term's range comes from a single vectorized binary search
+    symbols, lowered = _symbol_sorted(data, version)
+    prefixes = np.array(terms)
+    lo = np.searchsorted(lowered, prefixes, side='left')
+    hi = np.searchsorted(lowered, np.char.add(prefixes, '\uffff'), side='right')
+
+    matched = np.zeros(len(symbols), dtype=bool)
+    for start, stop in zip(lo, hi):
+        matched[start:stop] = True
+    return symbols[matched].tolist()
+
+
+
+
+def apply_sector_series_filters(filtered_data):
+    """Add the sidebar Sector/Series filters for the date-filtered data and apply them"""
+    # Get only the sectors present in the filtered data
+    available_sectors = ['All'] + sorted(filtered_data['Sector'].unique().tolist())
+    selected_sectors = st.sidebar.selectbox("Filter by Sector:", available_sectors)
+
+    # Get series types from the date-filtered data
+    available_series = ['All'] + sorted(filtered_data['Series Type'].unique().tolist())
+    selected_series = st.sidebar.selectbox("Filter by Series:", available_series)
+
+    # Apply additional filters
+    if selected_sectors != 'All':
+        filtered_data = filtered_data[filtered_data['Sector'] == selected_sectors]
+    if selected_series != 'All':
+        filtered_data = filtered_data[filtered_data['Series Type'] == selected_series]
+
+    return filtered_data, (selected_sectors, selected_series)
+
+def sector_counts_table(filtered_data):
+    """Sector counts and share of total"""
+    # value_counts is already sorted descending; unobserved categories show up as zeros
+    counts = filtered_data['Sector'].value_counts()
+    counts = counts[counts > 0]
+    # Share of total as one multiply over the count buffer
+    values = counts.to_numpy()
+    return pd.DataFrame({
+        'Sector': counts.index,
+        'Count': values,
+        'Percentage': (values * (100.0 / values.sum())).round(2),
+    })
+
+def compute_stock_table(filtered_data):
+    """Distinct days each stock appeared, with its series and sector"""
+    # Distinct days per stock: pack each (symbol code, day code) pair into one int64,
+    # keep the unique pairs and count them per symbol code with bincount
+    symbol_codes = filtered_data['Symbol'].cat.codes.to_numpy().astype('int64')
+    days = filtered_data["Today's Date"].to_numpy().astype('datetime64[D]').view('i8')
+    day_codes, day_uniques = pd.factorize(days)
+    has_symbol = symbol_codes >= 0
+    pairs = np.unique(symbol_codes[has_symbol] * len(day_uniques) + day_codes[has_symbol])
+    n_symbols = len(filtered_data['Symbol'].cat.categories)
+    occurrences = np.bincount(pairs // len(day_uniques), minlength=n_symbols)
+
+    # Symbols present in the window, in code (symbol) order, which the stable sort keeps as the tie order
+    present = np.flatnonzero(occurrences)
+    order = present[np.argsort(-occurrences[present], kind='stable')]
+
+    # Series and sector are each symbol's first non-missing value in the window, as groupby
+    # 'first' gives; gather every column by position and build the frame once at the end
+    columns = {
+        'Symbol': pd.Categorical.from_codes(order, dtype=filtered_data['Symbol'].dtype),
+        'Occurrences': occurrences[order],
+    }
+    for col in ['Series Type', 'Sector']:
+        rows = _first_valid_rows(filtered_data[col], symbol_codes, n_symbols)[order]
+        columns[col] = filtered_data[col].array.take(rows, allow_fill=True)
+    return pd.DataFrame(columns)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def frequency_tables(_filtered_data, filter_key):
+    """Sector counts and stock occurrences for one filter state, cached together as one entry"""
+    stock_table = compute_stock_table(_filtered_data)
+
+    # Each symbol links to its screener page. Symbols such as M&M need URL escaping, which has no
+    # vectorized form, so a comprehension over the raw array skips per-element pandas dispatch
+    stock_table['Symbol'] = [
+        f"https://www.screener.in/company/{quote(symbol, safe='')}"
+        for symbol in stock_table['Symbol'].to_numpy()
     ]
+    return sector_counts_table(_filtered_data), stock_table
+
+def render_overview(filtered_data, title):
+    """Render the header, metrics row and sector chart shared by the date-based views"""
+    st.header(f"Analysis for {title}")
+
+    # Metrics row, aggregated in a single call
+    stats = filtered_data.agg({'Symbol': 'nunique', 'Sector': 'nunique', '%chng': 'mean'})
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Stocks", int(stats['Symbol']))
+    with col2:
+        st.metric("Total Sectors", int(stats['Sector']))
+    with col3:
+        st.metric("Average Change", f"{stats['%chng']:+.2f}%")
+
+    # Sector chart - full width
+    st.plotly_chart(create_sector_chart(filtered_data), use_container_width=True)
+
+def render_frequency_tables(filtered_data, filter_key, period):
+    """Render the sector distribution and most frequent stocks tables for a period view"""
+    # Sector table - below chart
+    st.markdown("### 📊 Sector Distribution")
+    sector_counts, stock_table = frequency_tables(filtered_data, filter_key)
+    
+    # Apply custom CSS
+    st.markdown("""
+        <style>
+            div[data-testid="stDataFrame"] div[data-testid="stTable"] {
+                font-size: 1.1rem;
+            }
+            div[data-testid="stDataFrame"] th {
+                background-color: #1E3A5F;
+                color: white;
+                font-weight: bold;
+            }
+        </style>
+    """, unsafe_allow_html=True)
+    
+    # Make sure data is properly converted to basic Python types
+    st.dataframe(
+        sector_counts,
+        hide_index=True,
+        column_config={
+            "Sector": "Sector",
+            "Count": st.column_config.NumberColumn(
+                "Count",
+                format="%d"
+            ),
+            "Percentage": st.column_config.ProgressColumn(
+                "% of Total",
+                format="%.1f%%",
+                min_value=0,
+                max_value=100
+            )
+        },
+        use_container_width=True
+    )
+    
+    # Stock occurrences table
+    st.markdown("### 📈 Most Frequent Stocks")
+    st.markdown(f"Stocks that appeared most frequently during the {period}")
+    
+    # Get the maximum occurrences for the progress bar (a NumPy reduction); the bar starts at 0,
+    # so a top count of 1, or the empty-table fallback, still gives the grid a valid range
+    occurrences = stock_table['Occurrences'].to_numpy()
+    max_occurrences = int(occurrences.max()) if occurrences.size else 1
+    
+    # The grid ships the table to the browser as Arrow and only paints the visible rows,
+    # so no HTML is serialized on the server
+    st.dataframe(
+        stock_table,
+        hide_index=True,
+        column_config={
+            "Symbol": st.column_config.LinkColumn(
+                "Symbol",
+                display_text=r"https://www\.screener\.in/company/(.*)"
+            ),
+            "Occurrences": st.column_config.ProgressColumn(
+                "Frequency",
+                help="Number of days stock appeared",
+                format="%d times",
+                min_value=0,
+                max_value=max_occurrences
+            ),
+            "Series Type": "Series",
+            "Sector": "Sector"
+        },
+        use_container_width=True
+    )
+
+@st.fragment
+def _specific_date_body(filtered_data, date_display, filter_key):
+    """Main-area content of the Specific Date view"""
+    render_overview(filtered_data, date_display)
+
+    # Stock cards
+    st.header("Stock Details")
+    latest_stock_data = get_latest_stock_data(filtered_data, filter_key)
+
+    render_stock_cards(latest_stock_data, filter_key)
+
+@st.fragment
+def _period_body(filtered_data, date_display, filter_key, period):
+    """Main-area content of the Month and Date Range views"""
+    render_overview(filtered_data, date_display)
+    render_frequency_tables(filtered_data, filter_key, period)
+
+@st.fragment
+def _search_body(data, search_symbols, version):
+    """Main-area content of the Search Stock view"""
+    if search_symbols:
+        for symbol in search_symbols:
+            # Title with stock symbol and current metrics
+            st.markdown(f"""
+                <div style='background-color: rgba(17, 24, 39, 0.7); padding: 20px; border-radius: 10px; margin-bottom: 25px'>
+                    <h2 style='margin: 0; color: #00FFFF'>{symbol} Analysis</h2>
+                </div>
+            """, unsafe_allow_html=True)
+
+            high_dates, stock_data = get_stock_highs(data, symbol, version)
+
+            if not stock_data.empty:
+                # Key metrics in a clean layout
+                highest_price = stock_data['LTP'].max()
+
+                metrics_container = st.container()
+                with metrics_container:
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric(
+                            "52-Week High",
+                            format_number(highest_price),
+                            delta=None
+                        )
+                    with col3:
+                        st.metric(
+                            "High Points Found",
+                            f"{len(high_dates)} dates" if not high_dates.empty else "0"
+                        )
+
+                # High points table with enhanced styling
+                if not high_dates.empty:
+                    st.markdown("### 📊 High Points Timeline")
+                    display_df = high_dates.sort_values("Today's Date", ascending=False)
+
+                    # Enhanced data preparation
+                    display_df['Date'] = display_df["Today's Date"].dt.strftime('%d %B %Y')
+                    display_df['Price'] = vec_format_number(display_df['LTP'])
+                    change = display_df['%chng'].to_numpy(dtype='float64', na_value=np.nan)
+                    display_df['Change'] = np.where(
+                        np.isnan(change),
+                        "N/A",
+                        np.char.add(np.where(change > 0, '💹', '🔻'), np.char.mod('%+.2f%%', change))
+                    )
+
+                    # Calculate days from previous high
+                    # display_df['Days Gap'] = display_df["Today's Date"].diff(-1).dt.days
+                    # display_df['Days Gap'] = display_df['Days Gap'].fillna("First High")
+
+                    # Enhanced table display
+                    st.dataframe(
+                        display_df[['Date', 'Price', 'Change']],
+                        hide_index=True,
+                        column_config={
+                            "Date": st.column_config.Column(
+                                "Date",
+                                help="Date when stock reached a high point",
+                                width="medium"
+                            ),
+                            "Price": st.column_config.Column(
+                                "Stock Price",
+                                help="Stock price at high point",
+                                width="medium"
+                            ),
+                            "Change": st.column_config.Column(
+                                "Daily Change",
+                                help="Percentage change on that day",
+                                width="medium"
+                            )
+                        },use_container_width=True
+                    )
+
+                    # Price chart with improved styling
+                    # st.markdown("### 📈 Price Chart")
+                    # fig = go.Figure()
+
+                    # # Main price line
+                    # fig.add_trace(go.Scatter(
+                    #     x=stock_data["Today's Date"],
+                    #     y=stock_data['LTP'],
+                    #     name='Price',
+                    #     line=dict(color='#00FFFF', width=1)
+                    # ))
+
+                    # # High points markers
+                    # fig.add_trace(go.Scatter(
+                    #     x=high_dates["Today's Date"],
+                    #     y=high_dates['LTP'],
+                    #     mode='markers',
+                    #     name='High Points',
+                    #     marker=dict(
+                    #         color='#00FF00',
+                    #         size=10,
+                    #         symbol='diamond',
+                    #         line=dict(color='white', width=1)
+                    #     )
+                    # ))
+
+                    # fig.update_layout(
+                    #     xaxis_title="Date",
+                    #     yaxis_title="Price (₹)",
+                    #     template='plotly_dark',
+                    #     height=500,
+                    #     hovermode='x unified',
+                    #     paper_bgcolor='rgba(17, 24, 39, 0.7)',
+                    #     plot_bgcolor='rgba(17, 24, 39, 0.7)',
+                    #     showlegend=True,
+                    #     legend=dict(
+                    #         yanchor="top",
+                    #         y=0.99,
+                    #         xanchor="left",
+                    #         x=0.01,
+                    #         bgcolor="rgba(17, 24, 39, 0.7)"
+                    #     ),
+                    #     margin=dict(l=0, r=0, t=0, b=0, pad=0)
+                    # )
+
+                    # st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.warning(f"No data found for symbol {symbol}")
+    else:
+        st.info("Please select one or more stock symbols to view their analysis")
+
+# Sidebar inputs stay in the view functions: Streamlit does not allow fragments to write to st.sidebar
+def _view_specific_date(data, version):
+    """Sidebar date and filter inputs for the Specific Date view"""
+    with st.sidebar:
+        selected_date = st.date_input(
+            "Select Date",
+            data["Today's Date"].max(),
+            min_value=data["Today's Date"].min(),
+            max_value=data["Today's Date"].max()
+        )
+        # First filter by date
+        filtered_data = date_slice(data, selected_date, selected_date)
+        date_display = selected_date.strftime('%d %B %Y')
+
+        filtered_data, filters = apply_sector_series_filters(filtered_data)
+        filter_key = (version, "Specific Date📆", selected_date, filters)
+
+    if not filtered_data.empty:
+        _specific_date_body(filtered_data, date_display, filter_key)
+    else:
+        st.warning("No data found for the selected filters.")
+
+def _view_month(data, version):
+    """Sidebar month and filter inputs for the Month view"""
+    month = month_labels(data["Today's Date"], version)
+    months = month.cat.categories.tolist()
+    selected_month = st.sidebar.selectbox("Select Month", months)
+    
+    filtered_data = data[month == selected_month]
+    date_display = selected_month
+
+    filtered_data, filters = apply_sector_series_filters(filtered_data)
+    filter_key = (version, "Month📅", selected_month, filters)
+    
+    if not filtered_data.empty:
+        _period_body(filtered_data, date_display, filter_key, "month")
+    else:
+        st.warning(f"No data found for {selected_month}")
+
+def _view_range(data, version):
+    """Sidebar date range and filter inputs for the Date Range view"""
+    # Get min and max dates for the range selector
+    min_date = data["Today's Date"].min()
+    max_date = data["Today's Date"].max()
+    
+    # Create date range selector
+    col1, col2 = st.sidebar.columns(2)
+    with col1:
+        start_date = st.date_input("Start Date", min_date, min_value=min_date, max_value=max_date)
+    with col2:
+        end_date = st.date_input("End Date", max_date, min_value=min_date, max_value=max_date)
     
-    return sorted(filtered_symbols)
+    # Filter data based on selected date range
+    filtered_data = date_slice(data, start_date, end_date)
+    date_display = f"{start_date.strftime('%d %b %Y')} to {end_date.strftime('%d %b %Y')}"
 
+    filtered_data, filters = apply_sector_series_filters(filtered_data)
+    filter_key = (version, "Date Range⏳", start_date, end_date, filters)
+    
+    if not filtered_data.empty:
+        _period_body(filtered_data, date_display, filter_key, "selected period")
+    else:
+        st.warning(f"No data found between {start_date} and {end_date}")
+
+def _view_search(data, version):
+    """Sidebar symbol picker for the Search Stock view"""
+    with st.sidebar:
+        # Get all unique stock symbols
+        all_symbols, _ = _symbol_sorted(data, version)
+        search_symbols = st.multiselect(
+            "Search Stock Symbol",
+            options=all_symbols,
+            placeholder="Select stock symbols to analyze"
+        )
 
+    _search_body(data, search_symbols, version)
 
+VIEWS = {
+    "Specific Date📆": _view_specific_date,
+    "Date Range⏳": _view_range,
+    "Month📅": _view_month,
+    "Search Stock🔎": _view_search,
+}
 
 def main():
     st.set_page_config(layout="wide", page_title="Stock Data Dashboard")
@@ -327,483 +936,17 @@ def main():
         st.error("No data available. Please check your CSV file.")
         return
     
-    # Initialize filtered_data as empty DataFrame
-    filtered_data = pd.DataFrame()
-    date_display = ""
-    search_text = ""
-    
+    version = data_version(data)
+
     # Sidebar filters
     with st.sidebar:
         st.header("Filters")
         view_type = st.radio(
             "Select View Type",
-            ["Specific Date📆", "Date Range⏳", "Month📅", "Search Stock🔎"]
+            list(VIEWS)
         )
 
-        if view_type == "Specific Date📆":
-            selected_date = st.date_input(
-                "Select Date",
-                data["Today's Date"].max(),
-                min_value=data["Today's Date"].min(),
-                max_value=data["Today's Date"].max()
-            )
-            # First filter by date
-            filtered_data = data[data["Today's Date"].dt.date == selected_date]
-            date_display = selected_date.strftime('%d %B %Y')
-
-            # Get only the sectors present in the filtered data
-            available_sectors = ['All'] + sorted(filtered_data['Sector'].unique().tolist())
-            selected_sectors = st.selectbox("Filter by Sector:", available_sectors)
-
-            # Get series types from the date-filtered data
-            available_series = ['All'] + sorted(filtered_data['Series Type'].unique().tolist())
-            selected_series = st.selectbox("Filter by Series:", available_series)
-
-            # Apply additional filters
-            if selected_sectors != 'All':
-                filtered_data = filtered_data[filtered_data['Sector'] == selected_sectors]
-            if selected_series != 'All':
-                filtered_data = filtered_data[filtered_data['Series Type'] == selected_series]
-
-        elif view_type == "Search Stock🔎":
-            # Get all unique stock symbols
-            all_symbols = sorted(data['Symbol'].unique())
-            search_symbols = st.multiselect(
-                "Search Stock Symbol",
-                options=all_symbols,
-                placeholder="Select stock symbols to analyze"
-            )
-            
-            # Simple search by exact match
-    if view_type == "Search Stock🔎":
-        if search_symbols:
-            for symbol in search_symbols:
-                # Title with stock symbol and current metrics
-                st.markdown(f"""
-                    <div style='background-color: rgba(17, 24, 39, 0.7); padding: 20px; border-radius: 10px; margin-bottom: 25px'>
-                        <h2 style='margin: 0; color: #00FFFF'>{symbol} Analysis</h2>
-                    </div>
-                """, unsafe_allow_html=True)
-
-                high_dates, stock_data = get_stock_highs(data, symbol)
-
-                if not stock_data.empty:
-                    # Key metrics in a clean layout
-                    highest_price = stock_data['LTP'].max()
-                    
-                    metrics_container = st.container()
-                    with metrics_container:
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric(
-                                "52-Week High",
-                                format_number(highest_price),
-                                delta=None
-                            )
-                        with col3:
-                            st.metric(
-                                "High Points Found",
-                                f"{len(high_dates)} dates" if not high_dates.empty else "0"
-                            )
-
-                    # High points table with enhanced styling
-                    if not high_dates.empty:
-                        st.markdown("### 📊 High Points Timeline")
-                        display_df = high_dates.copy()
-                        display_df = display_df.sort_values("Today's Date", ascending=False)
-                        
-                        # Enhanced data preparation
-                        display_df['Date'] = display_df["Today's Date"].dt.strftime('%d %B %Y')
-                        display_df['Price'] = display_df['LTP'].apply(format_number)
-                        display_df['Change'] = display_df['%chng'].apply(
-                            lambda x: f"{'💹' if x > 0 else '🔻'}{x:+.2f}%" if pd.notnull(x) else "N/A"
-                        )
-                        
-                        # Calculate days from previous high
-                        # display_df['Days Gap'] = display_df["Today's Date"].diff(-1).dt.days
-                        # display_df['Days Gap'] = display_df['Days Gap'].fillna("First High")
-                        
-                        # Enhanced table display
-                        st.dataframe(
-                            display_df[['Date', 'Price', 'Change']],
-                            hide_index=True,
-                            column_config={
-                                "Date": st.column_config.Column(
-                                    "Date",
-                                    help="Date when stock reached a high point",
-                                    width="medium"
-                                ),
-                                "Price": st.column_config.Column(
-                                    "Stock Price",
-                                    help="Stock price at high point",
-                                    width="medium"
-                                ),
-                                "Change": st.column_config.Column(
-                                    "Daily Change",
-                                    help="Percentage change on that day",
-                                    width="medium"
-                                )
-                            },use_container_width=True
-                        )
-
-                        # Price chart with improved styling
-                        # st.markdown("### 📈 Price Chart")
-                        # fig = go.Figure()
-                        
-                        # # Main price line
-                        # fig.add_trace(go.Scatter(
-                        #     x=stock_data["Today's Date"],
-                        #     y=stock_data['LTP'],
-                        #     name='Price',
-                        #     line=dict(color='#00FFFF', width=1)
-                        # ))
-
-                        # # High points markers
-                        # fig.add_trace(go.Scatter(
-                        #     x=high_dates["Today's Date"],
-                        #     y=high_dates['LTP'],
-                        #     mode='markers',
-                        #     name='High Points',
-                        #     marker=dict(
-                        #         color='#00FF00',
-                        #         size=10,
-                        #         symbol='diamond',
-                        #         line=dict(color='white', width=1)
-                        #     )
-                        # ))
-
-                        # fig.update_layout(
-                        #     xaxis_title="Date",
-                        #     yaxis_title="Price (₹)",
-                        #     template='plotly_dark',
-                        #     height=500,
-                        #     hovermode='x unified',
-                        #     paper_bgcolor='rgba(17, 24, 39, 0.7)',
-                        #     plot_bgcolor='rgba(17, 24, 39, 0.7)',
-                        #     showlegend=True,
-                        #     legend=dict(
-                        #         yanchor="top",
-                        #         y=0.99,
-                        #         xanchor="left",
-                        #         x=0.01,
-                        #         bgcolor="rgba(17, 24, 39, 0.7)"
-                        #     ),
-                        #     margin=dict(l=0, r=0, t=0, b=0, pad=0)
-                        # )
-
-                        # st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning(f"No data found for symbol {symbol}")
-        else:
-            st.info("Please select one or more stock symbols to view their analysis")    
-
-    # Main content for Specific Date view
-    if view_type == "Specific Date📆" and not filtered_data.empty:
-        st.header(f"Analysis for {date_display}")
-
-        # Metrics row
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Stocks", len(filtered_data['Symbol'].unique()))
-        with col2:
-            st.metric("Total Sectors", len(filtered_data['Sector'].unique()))
-        with col3:
-            avg_change = filtered_data['%chng'].mean()
-            st.metric("Average Change", f"{avg_change:+.2f}%")
-        
-        st.plotly_chart(create_sector_chart(filtered_data), use_container_width=True)
-
-        # Stock cards
-        st.header("Stock Details")
-        latest_stock_data = get_latest_stock_data(filtered_data)
-
-        for idx, row in latest_stock_data.iterrows():
-            create_stock_card(row)
-
-    elif view_type == "Specific Date📆":
-        st.warning("No data found for the selected filters.")
-
-    elif view_type == "Month📅":
-        data['Month'] = data["Today's Date"].dt.strftime('%B %Y')
-        months = sorted(data['Month'].unique(), 
-                    key=lambda x: datetime.strptime(x, '%B %Y'))
-        selected_month = st.sidebar.selectbox("Select Month", months)
-        
-        filtered_data = data[data["Today's Date"].dt.strftime('%B %Y') == selected_month]
-        date_display = selected_month
-
-        available_sectors = ['All'] + sorted(filtered_data['Sector'].unique().tolist())
-        selected_sectors = st.sidebar.selectbox("Filter by Sector:", available_sectors)
-
-
-        # Get series types from the date-filtered data
-        available_series = ['All'] + sorted(filtered_data['Series Type'].unique().tolist())
-        selected_series = st.sidebar.selectbox("Filter by Series:", available_series)
-
-            # Apply additional filters
-        if selected_sectors != 'All':
-            filtered_data = filtered_data[filtered_data['Sector'] == selected_sectors]
-        if selected_series != 'All':
-            filtered_data = filtered_data[filtered_data['Series Type'] == selected_series]
-
-
-        
-        if not filtered_data.empty:
-            st.header(f"Analysis for {date_display}")
-            
-            # Metrics row
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Stocks", len(filtered_data['Symbol'].unique()))
-            with col2:
-                st.metric("Total Sectors", len(filtered_data['Sector'].unique()))
-            with col3:
-                avg_change = filtered_data['%chng'].mean()
-                st.metric("Average Change", f"{avg_change:+.2f}%")
-            
-            # Sector chart - full width
-            st.plotly_chart(create_sector_chart(filtered_data), use_container_width=True)
-            
-            # Sector table - below chart
-            st.markdown("### 📊 Sector Distribution")
-            sector_counts = filtered_data['Sector'].value_counts().reset_index()
-            sector_counts.columns = ['Sector', 'Count']
-            sector_counts['Percentage'] = (sector_counts['Count'] / sector_counts['Count'].sum() * 100).round(2)
-            
-            
-            # Apply custom CSS
-            st.markdown("""
-                <style>
-                    div[data-testid="stDataFrame"] div[data-testid="stTable"] {
-                        font-size: 1.1rem;
-                    }
-                    div[data-testid="stDataFrame"] th {
-                        background-color: #1E3A5F;
-                        color: white;
-                        font-weight: bold;
-                    }
-                </style>
-            """, unsafe_allow_html=True)
-            
-            # Make sure data is properly converted to basic Python types
-            st.dataframe(
-                sector_counts,
-                hide_index=True,
-                column_config={
-                    "Sector": "Sector",
-                    "Count": st.column_config.NumberColumn(
-                        "Count",
-                        format="%d"
-                    ),
-                    "Percentage": st.column_config.ProgressColumn(
-                        "% of Total",
-                        format="%.1f%%",
-                        min_value=0,
-                        max_value=100
-                    )
-                },
-                use_container_width=True
-            )
-            
-            # Stock occurrences table
-            st.markdown("### 📈 Most Frequent Stocks")
-            st.markdown("Stocks that appeared most frequently during the month")
-            
-            # Count unique dates for each stock symbol
-            stock_occurrences = filtered_data.groupby('Symbol')["Today's Date"].nunique().reset_index()
-            stock_occurrences.columns = ['Symbol', 'Occurrences']
-            
-            # Get additional information for each stock - ensure numeric values
-            stock_info = filtered_data.groupby('Symbol').agg({
-                # 'LTP': 'last',
-                # '%chng': 'mean',
-                'Series Type': 'first',
-                'Sector': 'first'
-            }).reset_index()
-            
-            # Convert any potential problematic values
-            # stock_info['LTP'] = stock_info['LTP'].astype(float)
-            # stock_info['%chng'] = stock_info['%chng'].astype(float)
-            
-            # Merge occurrences with stock info
-            stock_table = pd.merge(stock_occurrences, stock_info, on='Symbol')
-            stock_table = stock_table.sort_values('Occurrences', ascending=False)
-            
-            # Get the maximum occurrences for the progress bar
-            max_occurrences = int(stock_table['Occurrences'].max())
-            
-            # Create the table with simplified column config
-
-            
-            # st.dataframe(
-            #     stock_table,
-            #     hide_index=True,
-            #     column_config={
-            #         "Symbol": st.column_config.TextColumn("Symbol"),
-            #         "Occurrences": st.column_config.ProgressColumn(
-            #             "Frequency",
-            #             help="Number of days stock appeared",
-            #             format="%d times",
-            #             min_value=1,
-            #             max_value=max(stock_table["Occurrences"])
-            #         ),
-            #         "Series Type": "Series",
-            #         "Sector": "Sector"
-            #     },
-            #     use_container_width=True
-            # )
-            stock_table['Symbol'] = stock_table['Symbol'].apply(
-        lambda symbol: f'<a href="https://www.screener.in/company/{symbol}" target="_blank">{symbol}</a>'
-    )
-
-            st.write(
-                stock_table.to_html(
-                    escape=False,  # Ensures HTML tags are rendered
-                    index=False  # Hides the index
-                ),
-                unsafe_allow_html=True
-            )
-        else:
-            st.warning(f"No data found for {selected_month}")
-    elif view_type == "Date Range⏳":
-    # Get min and max dates for the range selector
-        min_date = data["Today's Date"].min()
-        max_date = data["Today's Date"].max()
-        
-        # Create date range selector
-        col1, col2 = st.sidebar.columns(2)
-        with col1:
-            start_date = st.date_input("Start Date", min_date, min_value=min_date, max_value=max_date)
-        with col2:
-            end_date = st.date_input("End Date", max_date, min_value=min_date, max_value=max_date)
-        
-        # Filter data based on selected date range
-        filtered_data = data[
-            (data["Today's Date"].dt.date >= start_date) & 
-            (data["Today's Date"].dt.date <= end_date)
-        ]
-        date_display = f"{start_date.strftime('%d %b %Y')} to {end_date.strftime('%d %b %Y')}"
-
-        available_sectors = ['All'] + sorted(filtered_data['Sector'].unique().tolist())
-        selected_sectors = st.sidebar.selectbox("Filter by Sector:", available_sectors)
-
-
-        # Get series types from the date-filtered data
-        available_series = ['All'] + sorted(filtered_data['Series Type'].unique().tolist())
-        selected_series = st.sidebar.selectbox("Filter by Series:", available_series)
-
-            # Apply additional filters
-        if selected_sectors != 'All':
-            filtered_data = filtered_data[filtered_data['Sector'] == selected_sectors]
-        if selected_series != 'All':
-            filtered_data = filtered_data[filtered_data['Series Type'] == selected_series]
-        
-        if not filtered_data.empty:
-            st.header(f"Analysis for {date_display}")
-            
-            # Metrics row
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Stocks", len(filtered_data['Symbol'].unique()))
-            with col2:
-                st.metric("Total Sectors", len(filtered_data['Sector'].unique()))
-            with col3:
-                avg_change = filtered_data['%chng'].mean()
-                st.metric("Average Change", f"{avg_change:+.2f}%")
-            
-            # Sector chart - full width
-            st.plotly_chart(create_sector_chart(filtered_data), use_container_width=True)
-            
-            # Sector table - below chart
-            st.markdown("### 📊 Sector Distribution")
-            sector_counts = filtered_data['Sector'].value_counts().reset_index()
-            sector_counts.columns = ['Sector', 'Count']
-            sector_counts['Percentage'] = (sector_counts['Count'] / sector_counts['Count'].sum() * 100).round(2)
-            
-            # Apply custom CSS
-            st.markdown("""
-                <style>
-                    div[data-testid="stDataFrame"] div[data-testid="stTable"] {
-                        font-size: 1.1rem;
-                    }
-                    div[data-testid="stDataFrame"] th {
-                        background-color: #1E3A5F;
-                        color: white;
-                        font-weight: bold;
-                    }
-                </style>
-            """, unsafe_allow_html=True)
-            
-            # Make sure data is properly converted to basic Python types
-            st.dataframe(
-                sector_counts,
-                hide_index=True,
-                column_config={
-                    "Sector": "Sector",
-                    "Count": st.column_config.NumberColumn(
-                        "Count",
-                        format="%d"
-                    ),
-                    "Percentage": st.column_config.ProgressColumn(
-                        "% of Total",
-                        format="%.1f%%",
-                        min_value=0,
-                        max_value=100
-                    )
-                },
-                use_container_width=True
-            )
-
-            
-            # Stock occurrences table
-            st.markdown("### 📈 Most Frequent Stocks")
-            st.markdown("Stocks that appeared most frequently during the selected period")
-            
-            # Count unique dates for each stock symbol
-            stock_occurrences = filtered_data.groupby('Symbol')["Today's Date"].nunique().reset_index()
-            stock_occurrences.columns = ['Symbol', 'Occurrences']
-            
-            # Get additional information for each stock
-            stock_info = filtered_data.groupby('Symbol').agg({
-                'Series Type': 'first',
-                'Sector': 'first'
-            }).reset_index()
-            
-            # Merge occurrences with stock info
-            stock_table = pd.merge(stock_occurrences, stock_info, on='Symbol')
-            stock_table = stock_table.sort_values('Occurrences', ascending=False)
-            
-            stock_table['Symbol'] = stock_table['Symbol'].apply(
-        lambda symbol: f'<a href="https://www.screener.in/company/{symbol}" target="_blank">{symbol}</a>'
-    )
-            # Create the table with simplified column config
-            # st.dataframe(
-            #     stock_table,
-            #     hide_index=True,
-            #     column_config={
-            #         "Symbol": st.column_config.TextColumn("Symbol"),
-            #         "Occurrences": st.column_config.ProgressColumn(
-            #             "Frequency",
-            #             help="Number of days stock appeared",
-            #             format="%d times",
-            #             min_value=1,
-            #             max_value=max(stock_table["Occurrences"])
-            #         ),
-            #         "Series Type": "Series",
-            #         "Sector": "Sector"
-            #     },
-            #     use_container_width=True
-            # )
-
-            st.write(
-                stock_table.to_html(
-                    escape=False,  # Ensures HTML tags are rendered
-                    index=False  # Hides the index
-                ),
-                unsafe_allow_html=True
-            )
-        else:
-            st.warning(f"No data found between {start_date} and {end_date}")
+    VIEWS[view_type](data, version)
     
     
 if __name__ == "__main__":